@@ -10,20 +10,14 @@ from typing import Union, List, Tuple, Any
 from getnative.utils import GetnativeException, get_attr, get_source_filter, to_float
 
 import numpy as np
-from scipy.optimize import dual_annealing
 
 PLOT_ENABLED = True
+pyplot = None
 
 try:
     import matplotlib as mpl
-    import matplotlib.pyplot as pyplot
 except Exception:
-    try:
-        import matplotlib as mpl
-        mpl.use('Agg')
-        import matplotlib.pyplot as pyplot
-    except:
-        PLOT_ENABLED = False
+    PLOT_ENABLED = False
 
 """
 Rework by Gabriella Chaos - 2025
@@ -37,6 +31,38 @@ if core.version_number() < 55:
     core.add_cache = False
 imwri = getattr(core, "imwri", getattr(core, "imwrif", None))
 _modes = ["bilinear", "bicubic", "bl-bc", "all"]
+_raster_formats = {"png", "jpg", "jpeg", "tif", "tiff", "webp"}
+_plot_rc = {'agg.path.chunksize': 10000}  # the dense '.w-' line is drawn in chunks by Agg
+
+
+def _get_pyplot():
+    # pyplot is only imported when a plot window is requested, None if it is unavailable
+    global pyplot
+    if pyplot is None:
+        try:
+            import matplotlib.pyplot as pyplot
+        except Exception:
+            try:
+                mpl.use('Agg')
+                import matplotlib.pyplot as pyplot
+            except Exception:
+                pass
+
+    return pyplot
+
+
+def _agg_figure(**kwargs):
+    # renders off-screen without switching the backend of the host process, None if Agg is unavailable
+    try:
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+    except Exception:
+        return None
+
+    fig = Figure(**kwargs)
+    FigureCanvasAgg(fig)
+
+    return fig
 
 
 class _DefineScaler:
@@ -72,6 +98,14 @@ class _DefineScaler:
             self.descaler = partial(self.descaler, taps=self.taps)
             self.upscaler = partial(self.upscaler, filter_param_a=self.taps)
 
+    def descale(self, clip, width, height):
+        return self.descaler(clip, width, height)
+
+    def upscale(self, clip, width, height):
+        if (clip.width, clip.height) == (width, height):
+            return clip
+        return self.upscaler(clip, width, height)
+
     def check_input(self):
         if self.descaler is None and self.kernel == "spline64":
             raise GetnativeException(f'descale: spline64 support is missing, update descale (>r3).')
@@ -120,9 +154,38 @@ common_scaler = {
 }
 
 
+def _to_luma32(src):
+    # change format to GrayS with bitdepth 32 for descale
+    matrix_s = '709' if src.format.color_family == vapoursynth.RGB else None
+    src_luma32 = core.resize.Point(src, format=vapoursynth.YUV444PS, matrix_s=matrix_s)
+    src_luma32 = core.std.ShufflePlanes(src_luma32, 0, vapoursynth.GRAY)
+    # src_luma32 = core.std.Cache(src_luma32)  # Cache method no longer available/possible
+
+    return src_luma32
+
+
+def _relative_to_neighbours(vals):
+    # same as vals / np.convolve(vals, [0.5, 0., 0.5], 'same'), without the generic convolution
+    neighbours = np.zeros_like(vals)
+    neighbours[1:] += vals[:-1]
+    neighbours[:-1] += vals[1:]
+    neighbours *= 0.5
+
+    return vals / neighbours
+
+
+async def _fetch(clip, n, sem, out, progress=True):
+    async with sem:
+        if progress and (n % 16 == 0 or n == len(clip) - 1):
+            print(f"\r{n}/{len(clip) - 1}", end="")
+        frame = await asyncio.wrap_future(clip.get_frame_async(n))
+
+    out[n] = frame.props.PlaneStatsAverage
+
+
 class GetNative:
     def __init__(self, src, scaler, ar, min_h, max_h, frames, passes, mask_out, plot_scaling, plot_format, show_plot, no_save,
-                 steps, output_dir):
+                 steps, output_dir, sem=None, progress=True):
         self.plot_format = plot_format
         self.plot_scaling = plot_scaling
         self.src = src
@@ -130,15 +193,20 @@ class GetNative:
         self.max_h = max_h
         self.ar = ar
         self.scaler = scaler
-        self.frames = frames
+        self.frames = tuple(int(f) for f in frames)
+        self._frame_clips = {f: src[f] for f in self.frames}
         self.passes = passes
         self.mask_out = mask_out
         self.show_plot = show_plot
         self.no_save = no_save
         self.steps = steps
         self.output_dir = output_dir
+        self.sem = sem
+        self.progress = progress
         self.txt_output = ""
         self.resolutions = []
+        self.luma_by_frame = {}
+        self._reference_cache = {}
         self.filename = self.get_filename()
 
     async def run(self):
@@ -149,179 +217,65 @@ class GetNative:
 
         # if PLOT_ENABLED:
 
-        # change format to GrayS with bitdepth 32 for descale
-        sample_size = len(self.frames)
-        hs = list(range(self.min_h, self.max_h + 1, self.steps))
+        hs = range(self.min_h, self.max_h + 1, self.steps)
         ar = self.ar
+        height_ar = None
+        height_vals = None
+        width_vals = {}
+        self.luma_by_frame = {frame: _to_luma32(clip) for frame, clip in self._frame_clips.items()}
 
         for p in range(self.passes):
 
-            sampled_vals = 0.
-
-            for frame in self.frames:
-                src = self.src[frame.item()]
-                matrix_s = '709' if src.format.color_family == vapoursynth.RGB else None
-                src_luma32 = core.resize.Point(src, format=vapoursynth.YUV444PS, matrix_s=matrix_s)
-                src_luma32 = core.std.ShufflePlanes(src_luma32, 0, vapoursynth.GRAY)
-                # src_luma32 = core.std.Cache(src_luma32)  # Cache method no longer available/possible
-
-                # descale each individual frame
-                clip_list = [self.scaler.descaler(src_luma32, self.getw(h, not src.width&1), h) # allow odd resolutions for odd input
-                             for h in range(self.min_h, self.max_h + 1, self.steps)]
-                full_clip = core.std.Splice(clip_list, mismatch=True)
-                full_clip = self.scaler.upscaler(full_clip, src.width, src.height)
-                if self.ar != src.width / src.height:
-                    src_luma32 = self.scaler.upscaler(src_luma32, src.width, src.height)
-                expr_full = core.std.Expr([src_luma32 * full_clip.num_frames, full_clip], 'x y - abs dup 0.015 > swap 0 ?')
-                full_clip = core.std.CropRel(expr_full, 5, 5, 5, 5)
-                full_clip = core.std.PlaneStats(full_clip)
-                # full_clip = core.std.Cache(full_clip)  # Cache method no longer available/possible
-
-                tasks_pending = set()
-                futures = {}
-                vals = []
-                full_clip_len = len(full_clip)
-                for frame_index in range(len(full_clip)):
-                    print(f"\r{frame_index}/{full_clip_len-1}", end="")
-                    fut = asyncio.ensure_future(asyncio.wrap_future(full_clip.get_frame_async(frame_index)))
-                    tasks_pending.add(fut)
-                    futures[fut] = frame_index
-                    while len(tasks_pending) >= core.num_threads + 2:
-                        tasks_done, tasks_pending = await asyncio.wait(tasks_pending, return_when=asyncio.FIRST_COMPLETED)
-                        vals += [(futures.pop(task), task.result().props.PlaneStatsAverage) for task in tasks_done]
-
-                tasks_done, _ = await asyncio.wait(tasks_pending)
-                vals += [(futures.pop(task), task.result().props.PlaneStatsAverage) for task in tasks_done]
-                vals = [v for _, v in sorted(vals)]
-                sampled_vals = np.array(vals) + sampled_vals
-
-            vals = sampled_vals
-            vals = vals / sample_size
-            vals = vals.tolist()
-
-            ratios, vals, best_value, bob_mae, bob_resolution = self.analyze_results(vals, self.min_h)
+            height_ar = self.ar
+            height_vals = await self._sweep(heights=hs)
+
+            ratios, vals, best_value, bob_mae, bob_resolution = self.analyze_results(height_vals.tolist(), self.min_h)
 
             h = bob_resolution
             w_min = int((self.ar - 0.2) * h)
             w_max = min(int(float(self.src.width) * 9 / 10), int((self.ar + 0.2) * h))
-            w_sample_size = int((w_max - w_min) // self.steps)
-            sampled_vals = 0.
-
-            for frame in self.frames:
-                src = self.src[frame.item()]
-                matrix_s = '709' if src.format.color_family == vapoursynth.RGB else None
-                src_luma32 = core.resize.Point(src, format=vapoursynth.YUV444PS, matrix_s=matrix_s)
-                src_luma32 = core.std.ShufflePlanes(src_luma32, 0, vapoursynth.GRAY)
-                # src_luma32 = core.std.Cache(src_luma32)  # Cache method no longer available/possible
-
-                # descale each individual frame
-                clip_list = [self.scaler.descaler(src_luma32, w, h) # allow odd resolutions for odd input
-                             for w in range(w_min, w_max + 1, self.steps)]
-                full_clip = core.std.Splice(clip_list, mismatch=True)
-                full_clip = self.scaler.upscaler(full_clip, src.width, src.height)
-                if self.ar != src.width / src.height:
-                    src_luma32 = self.scaler.upscaler(src_luma32, src.width, src.height)
-                expr_full = core.std.Expr([src_luma32 * full_clip.num_frames, full_clip], 'x y - abs dup 0.015 > swap 0 ?')
-                full_clip = core.std.CropRel(expr_full, 5, 5, 5, 5)
-                full_clip = core.std.PlaneStats(full_clip)
-                # full_clip = core.std.Cache(full_clip)  # Cache method no longer available/possible
-
-                tasks_pending = set()
-                futures = {}
-                vals = []
-                full_clip_len = len(full_clip)
-                for frame_index in range(len(full_clip)):
-                    print(f"\r{frame_index}/{full_clip_len-1}", end="")
-                    fut = asyncio.ensure_future(asyncio.wrap_future(full_clip.get_frame_async(frame_index)))
-                    tasks_pending.add(fut)
-                    futures[fut] = frame_index
-                    while len(tasks_pending) >= core.num_threads + 2:
-                        tasks_done, tasks_pending = await asyncio.wait(tasks_pending, return_when=asyncio.FIRST_COMPLETED)
-                        vals += [(futures.pop(task), task.result().props.PlaneStatsAverage) for task in tasks_done]
-
-                tasks_done, _ = await asyncio.wait(tasks_pending)
-                vals += [(futures.pop(task), task.result().props.PlaneStatsAverage) for task in tasks_done]
-                vals = [v for _, v in sorted(vals)]
-                sampled_vals = np.array(vals) + sampled_vals
-
-            vals = sampled_vals
-            vals = vals / w_sample_size
-            vals = vals / np.convolve(vals, [0.5, 0., 0.5], 'same')
-            vals = vals.tolist()
+
+            # later passes often land on the same height and window again
+            if (h, w_min, w_max) not in width_vals:
+                vals = await self._sweep(widths=range(w_min, w_max + 1, self.steps), fixed_h=h)
+                width_vals[h, w_min, w_max] = _relative_to_neighbours(vals)
+            vals = width_vals[h, w_min, w_max]
 
             best_w = np.argmin(vals) * self.steps + w_min
             self.ar = float(best_w) / h
 
-        sampled_vals = 0.
-
-        for frame in self.frames:
-            src = self.src[frame.item()]
-            matrix_s = '709' if src.format.color_family == vapoursynth.RGB else None
-            src_luma32 = core.resize.Point(src, format=vapoursynth.YUV444PS, matrix_s=matrix_s)
-            src_luma32 = core.std.ShufflePlanes(src_luma32, 0, vapoursynth.GRAY)
-            # src_luma32 = core.std.Cache(src_luma32)  # Cache method no longer available/possible
-
-            # descale each individual frame
-            clip_list = [self.scaler.descaler(src_luma32, self.getw(h, not src.width&1), h) # allow odd resolutions for odd input
-                         for h in range(self.min_h, self.max_h + 1, self.steps)]
-            full_clip = core.std.Splice(clip_list, mismatch=True)
-            full_clip = self.scaler.upscaler(full_clip, src.width, src.height)
-            if self.ar != src.width / src.height:
-                src_luma32 = self.scaler.upscaler(src_luma32, src.width, src.height)
-            expr_full = core.std.Expr([src_luma32 * full_clip.num_frames, full_clip], 'x y - abs dup 0.015 > swap 0 ?')
-            full_clip = core.std.CropRel(expr_full, 5, 5, 5, 5)
-            full_clip = core.std.PlaneStats(full_clip)
-            # full_clip = core.std.Cache(full_clip)  # Cache method no longer available/possible
-
-            tasks_pending = set()
-            futures = {}
-            vals = []
-            full_clip_len = len(full_clip)
-            for frame_index in range(len(full_clip)):
-                print(f"\r{frame_index}/{full_clip_len-1}", end="")
-                fut = asyncio.ensure_future(asyncio.wrap_future(full_clip.get_frame_async(frame_index)))
-                tasks_pending.add(fut)
-                futures[fut] = frame_index
-                while len(tasks_pending) >= core.num_threads + 2:
-                    tasks_done, tasks_pending = await asyncio.wait(tasks_pending, return_when=asyncio.FIRST_COMPLETED)
-                    vals += [(futures.pop(task), task.result().props.PlaneStatsAverage) for task in tasks_done]
-
-            tasks_done, _ = await asyncio.wait(tasks_pending)
-            vals += [(futures.pop(task), task.result().props.PlaneStatsAverage) for task in tasks_done]
-            vals = [v for _, v in sorted(vals)]
-            sampled_vals = np.array(vals) + sampled_vals
-
-        vals = (sampled_vals / sample_size).tolist()
+        # the final sweep would repeat the last height sweep if the width refinement kept the aspect ratio
+        if height_vals is None or self.ar != height_ar:
+            height_vals = await self._sweep(heights=hs)
+        vals = height_vals.tolist()
 
         ratios, vals, best_value, bob_mae, bob_resolution = self.analyze_results(vals, self.min_h)
 
 
-        print("\n")  # move the cursor, so that you not start at the end of the progress bar
+        if self.progress:
+            print("\n")  # move the cursor, so that you not start at the end of the progress bar
 
-        self.txt_output += 'Raw data:\nResolution\t | Relative Error\t | Relative difference from last\n'
-        self.txt_output += '\n'.join([
-            f'{i * self.steps + self.min_h:4d}\t\t | {error:.10f}\t\t | {ratios[i]:.2f}'
-            for i, error in enumerate(vals)
+        self.txt_output = '\n'.join([
+            f'{self.txt_output}Raw data:',
+            'Resolution\t | Relative Error\t | Relative difference from last',
+            *(f'{i * self.steps + self.min_h:4d}\t\t | {error:.10f}\t\t | {ratios[i]:.2f}'
+              for i, error in enumerate(vals)),
         ])
 
-        if PLOT_ENABLED:
-
-            plot, fig = self.save_plot(vals)
+        plot, fig = self.save_plot(vals) if PLOT_ENABLED else (None, None)
+        if fig is not None:
             if not self.no_save:
                 if not os.path.isdir(self.output_dir):
                     os.mkdir(self.output_dir)
 
                 print(f"Output Path: {self.output_dir}")
-                for fmt in self.plot_format.replace(" ", "").split(','):
-                    fig.savefig(f'{self.output_dir}/{self.filename}.{fmt}')
+                self.save_figure(fig)
 
                 with open(f"{self.output_dir}/{self.filename}.txt", "w") as stream:
-                    stream.writelines(self.txt_output)
+                    stream.write(self.txt_output)
 
                 if self.mask_out:
-                    self.save_images(src_luma32)
-        else:
-            plot = None
+                    self.save_images(self.luma_by_frame[self.frames[-1]])
 
         h = bob_resolution
         w = self.getw(bob_resolution)
@@ -332,6 +286,65 @@ class GetNative:
 
         return bob_resolution, self.getw(bob_resolution), bob_mae, overstretched
 
+    async def _sweep(self, heights=None, widths=None, fixed_h=None):
+        """
+        Descale the sampled frames to every candidate resolution, upscale them again and measure the error
+
+        :param heights: heights to test, the widths follow the current aspect ratio
+        :param widths: widths to test at the height fixed_h
+        :param fixed_h: height used for the widths
+        :return: numpy array with the relative error of each candidate, averaged over all sampled frames
+        """
+        if heights is not None:
+            # same as getw, once for the whole sweep
+            heights = np.asarray(heights)
+            ws = np.rint(heights * self.ar).astype(int)
+            if not self.src.width & 1:  # allow odd resolutions for odd input
+                ws = ws // 2 * 2
+            dims = list(zip(np.minimum(ws, self.src.width).tolist(), heights.tolist()))
+        else:
+            dims = [(w, fixed_h) for w in widths]
+
+        src = self.src
+        sampled_vals = np.empty((len(self.frames), len(dims)), dtype=np.float64)
+        # shared with concurrent runs if given, so they don't multiply the frames in flight
+        sem = self.sem if self.sem is not None else asyncio.Semaphore(core.num_threads + 2)
+        fetches = []
+
+        for k, frame in enumerate(self.frames):
+            src_luma32 = self.luma_by_frame[frame]
+
+            # descale each individual frame
+            clip_list = [self.scaler.descale(src_luma32, w, h) for w, h in dims]
+            full_clip = core.std.Splice(clip_list, mismatch=True)
+            full_clip = self.scaler.upscale(full_clip, src.width, src.height)
+            # crop before the Expr, so the difference is only computed for the measured area
+            full_clip = core.std.CropRel(full_clip, 5, 5, 5, 5)
+            reference = self.get_reference(frame, full_clip.num_frames)
+            expr_full = core.std.Expr([reference, full_clip], 'x y - abs dup 0.015 > swap 0 ?')
+            full_clip = core.std.PlaneStats(expr_full)
+            # full_clip = core.std.Cache(full_clip)  # Cache method no longer available/possible
+
+            fetches += [_fetch(full_clip, i, sem, sampled_vals[k], self.progress) for i in range(len(full_clip))]
+
+        # request all sampled frames at once, so the threads don't idle between them
+        await asyncio.gather(*fetches)
+
+        return sampled_vals.mean(axis=0)
+
+    def get_reference(self, frame, num_frames):
+        # cropped luma of a sampled frame, looped to the length of a sweep
+        # the luma already has the source dimensions, so it is never resized here, whatever the aspect ratio
+        key = (frame, num_frames)
+        if key not in self._reference_cache:
+            src_luma32 = core.std.CropRel(self.luma_by_frame[frame], 5, 5, 5, 5)
+            if get_attr(core, 'std.Loop') is not None:
+                self._reference_cache[key] = core.std.Loop(src_luma32, times=num_frames)
+            else:
+                self._reference_cache[key] = core.std.Interleave([src_luma32] * num_frames)
+
+        return self._reference_cache[key]
+
     def getw(self, h, only_even=True):
         w = h * self.ar
         w = int(round(w))
@@ -341,26 +354,26 @@ class GetNative:
         return min(w, self.src.width)
 
     def analyze_results(self, vals, offset):
-        ratios = [0.0]
-        for i in range(1, len(vals)):
-            last = vals[i - 1]
-            current = vals[i]
-            ratios.append(current and last / current)
-        sorted_array = sorted(ratios, reverse=True)  # make a copy of the array because we need the unsorted array later
-        max_difference = sorted_array[0]
-
-        differences = [s for s in sorted_array if s - 1 > (max_difference - 1) * 0.33][:5]
-
-        for diff in differences:
-            current = ratios.index(diff)
+        vals_arr = np.asarray(vals, dtype=np.float64)
+        ratios = np.zeros(len(vals_arr))
+        np.divide(vals_arr[:-1], vals_arr[1:], out=ratios[1:], where=vals_arr[1:] != 0)
+
+        # only the five largest ratios can be picked, so skip sorting the rest
+        k = min(5, len(ratios))
+        top = np.argpartition(-ratios, k - 1)[:k]
+        top = top[np.lexsort((top, -ratios[top]))]
+        max_difference = ratios[top[0]]
+
+        differences = top[ratios[top] - 1 > (max_difference - 1) * 0.33]
+        # equal ratios resolve to their first occurrence
+        differences = np.argmax(ratios == ratios[differences][:, None], axis=1)
+
+        for current in differences.tolist():
             # don't allow results within 20px of each other
-            for res in self.resolutions:
-                if res - 20 < current < res + 20:
-                    break
-            else:
+            if not self.resolutions or np.abs(np.subtract(self.resolutions, current)).min() >= 20:
                 self.resolutions.append(current)
 
-        bob_idx = np.argmax(np.array(ratios)[self.resolutions])  # picked out to integrate other metrics
+        bob_idx = np.argmax(ratios[self.resolutions])  # picked out to integrate other metrics
         bob = vals[bob_idx]
         bob_resolution = self.resolutions[bob_idx] * self.steps + offset
 
@@ -380,26 +393,69 @@ class GetNative:
     # Modified from:
     # https://github.com/WolframRhodium/muvsfunc/blob/d5b2c499d1b71b7689f086cd992d9fb1ccb0219e/muvsfunc.py#L5807
     def save_plot(self, vals):
-        plot = pyplot
-        plot.close('all')
-        plot.style.use('dark_background')
-        fig, ax = plot.subplots(figsize=(12, 8))
-        ax.plot(range(self.min_h, self.max_h + 1, self.steps), vals, '.w-')
-        dh_sequence = tuple(range(self.min_h, self.max_h + 1, self.steps))
-        ticks = tuple(dh for i, dh in enumerate(dh_sequence) if i % ((self.max_h - self.min_h + 10 * self.steps - 1) // (10 * self.steps)) == 0)
-        ax.set(xlabel="Height", xticks=ticks, ylabel="Relative error", title=self.filename, yscale="log")
-        if self.show_plot:
-            plot.show()
+        plot = _get_pyplot() if self.show_plot else None
+        if plot is not None:
+            plot.close('all')
+        with mpl.style.context('dark_background'), mpl.rc_context(_plot_rc):
+            fig = plot.figure(figsize=(12, 8)) if plot is not None else _agg_figure(figsize=(12, 8))
+            if fig is None:
+                return None, None
+            ax = fig.subplots()
+            ax.plot(range(self.min_h, self.max_h + 1, self.steps), vals, '.w-')
+            dh_sequence = tuple(range(self.min_h, self.max_h + 1, self.steps))
+            ticks = tuple(dh for i, dh in enumerate(dh_sequence) if i % ((self.max_h - self.min_h + 10 * self.steps - 1) // (10 * self.steps)) == 0)
+            ax.set(xlabel="Height", xticks=ticks, ylabel="Relative error", title=self.filename, yscale="log")
+            if plot is not None:
+                plot.show()
 
         return plot, fig
 
+    def save_figure(self, fig):
+        formats = self.plot_format.replace(" ", "").split(',')
+        raster = [fmt for fmt in formats if fmt in _raster_formats]
+
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        # the shared render only matches savefig for the default savefig settings and a plain Agg canvas
+        share = (
+            len(raster) > 1
+            and type(fig.canvas) is FigureCanvasAgg  # gui canvases subclass it, but their draw() updates the window
+            and mpl.rcParams['savefig.dpi'] == 'figure'
+            and mpl.rcParams['savefig.bbox'] is None
+            and mpl.rcParams['savefig.facecolor'] == 'auto'
+            and mpl.rcParams['savefig.edgecolor'] == 'auto'
+            and not mpl.rcParams['savefig.transparent']
+        )
+
+        with mpl.rc_context(_plot_rc):
+            image = None
+            for fmt in formats:
+                path = f'{self.output_dir}/{self.filename}.{fmt}'
+                if not share or fmt not in _raster_formats:
+                    fig.savefig(path)
+                    continue
+
+                if image is None:
+                    # render once and share the pixels between all raster formats
+                    from PIL import Image, PngImagePlugin
+                    fig.canvas.draw()
+                    image = Image.fromarray(np.asarray(fig.canvas.buffer_rgba()))
+                    png_info = PngImagePlugin.PngInfo()
+                    png_info.add_text("Software", f"Matplotlib version{mpl.__version__}, https://matplotlib.org/")
+
+                if fmt == "png":
+                    image.save(path, dpi=(fig.dpi, fig.dpi), pnginfo=png_info)
+                elif fmt in ("jpg", "jpeg"):
+                    image.convert('RGB').save(path, dpi=(fig.dpi, fig.dpi))
+                else:
+                    image.save(path, dpi=(fig.dpi, fig.dpi))
+
     # Original idea by Chibi_goku http://recensubshq.forumfree.it/?t=64839203
     # Vapoursynth port by MonoS @github: https://github.com/MonoS/VS-MaskDetail
     def mask_detail(self, clip, final_width, final_height):
-        temp = self.scaler.descaler(clip, final_width, final_height)
-        temp = self.scaler.upscaler(temp, clip.width, clip.height)
+        temp = self.scaler.descale(clip, final_width, final_height)
+        temp = self.scaler.upscale(temp, clip.width, clip.height)
         mask = core.std.Expr([clip, temp], 'x y - abs dup 0.015 > swap 16 * 0 ?').std.Inflate()
-        mask = _DefineScaler(kernel="spline36").upscaler(mask, final_width, final_height)
+        mask = _DefineScaler(kernel="spline36").upscale(mask, final_width, final_height)
 
         return mask
 
@@ -412,7 +468,7 @@ class GetNative:
             image = self.mask_detail(src, self.getw(r), r)
             mask_out = imwri.Write(image, 'png', f'{self.output_dir}/{self.filename}_mask_{r:d}p%d.png')
             mask_out.get_frame(0)
-            descale_out = self.scaler.descaler(src, self.getw(r), r)
+            descale_out = self.scaler.descale(src, self.getw(r), r)
             descale_out = imwri.Write(descale_out, 'png', f'{self.output_dir}/{self.filename}_{r:d}p%d.png')
             descale_out.get_frame(0)
 
@@ -426,7 +482,8 @@ class GetNative:
 
 
 async def getnative(args: Union[List, argparse.Namespace], src: vapoursynth.VideoNode, scaler: Union[_DefineScaler, None],
-              first_time: bool = True) -> Tuple[str, Any, GetNative]:
+              first_time: bool = True, sem: Union[asyncio.Semaphore, None] = None,
+              verbose: bool = True) -> Tuple[str, Any, GetNative]:
     """
     Process your VideoNode with the getnative algorithm and return the result and a plot object
 
@@ -434,10 +491,12 @@ async def getnative(args: Union[List, argparse.Namespace], src: vapoursynth.Vide
     :param src: VideoNode from vapoursynth
     :param scaler: DefineScaler object or None
     :param first_time: prevents posting warnings multiple times
+    :param sem: semaphore bounding the frame requests, shared by concurrent runs (default: one per sweep)
+    :param verbose: print the progress and the result of this run
     :return: best resolutions string, plot matplotlib.pyplot and GetNative class object
     """
 
-    if type(args) == list:
+    if not isinstance(args, argparse.Namespace):
         args = parser.parse_args(args)
 
     output_dir = Path(args.dir).resolve()
@@ -484,7 +543,8 @@ async def getnative(args: Union[List, argparse.Namespace], src: vapoursynth.Vide
         args.max_h = src.height
 
     getn = GetNative(src, scaler, args.ar, args.min_h, args.max_h, frames, args.passes, args.mask_out, args.plot_scaling,
-                     args.plot_format, args.show_plot, args.no_save, args.steps, output_dir)
+                     args.plot_format, args.show_plot, args.no_save, args.steps, output_dir,
+                     sem=sem, progress=verbose)
     try:
         h, w, mae, overstretched = await getn.run()
     except ValueError as err:
@@ -497,13 +557,30 @@ async def getnative(args: Union[List, argparse.Namespace], src: vapoursynth.Vide
         near_ub = False
 
     gc.collect()
+    if verbose:
+        _print_result(scaler, h, w, mae)
+
+    return (h, w), mae, overstretched, near_ub
+
+
+def _print_result(scaler, h, w, mae):
     print(
         f"\n{scaler} AR: {float(w) / h:.2f} "
         f"{w} x {h} "
         f"MAE: {mae}"
     )
 
-    return (h, w), mae, overstretched, near_ub
+
+async def _run_all(runs):
+    tasks = [asyncio.ensure_future(run) for run in runs]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        # don't leave the other scalers running once one has failed
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
 
 
 def _getnative():
@@ -534,15 +611,25 @@ def _getnative():
     res_dict = {}
     ub_dict = {}
 
-    loop = asyncio.get_event_loop()
+    scalers = []
     for i, scaler in enumerate(mode):
         if scaler is not None and scaler.plugin is None:
             print(f"Warning: No correct descale version found for {scaler}, continuing with next scaler when available.")
             continue
-        res, mae, overstretched, near_ub = loop.run_until_complete(
-            getnative(args, src, scaler, first_time=True if i == 0 else False)
-        )
+        scalers.append((i, scaler))
 
+    # the scalers are independent, so one can keep the vapoursynth threads busy while another is in python.
+    # they share one semaphore, so the frames in flight stay bounded by the thread count
+    loop = asyncio.get_event_loop()
+    sem = asyncio.Semaphore(core.num_threads + 2)
+    verbose = len(scalers) == 1
+    runs = [getnative(args, src, scaler, first_time=True if i == 0 else False, sem=sem, verbose=verbose)
+            for i, scaler in scalers]
+    results = loop.run_until_complete(_run_all(runs))
+
+    for (_, scaler), (res, mae, overstretched, near_ub) in zip(scalers, results):
+        if not verbose:
+            _print_result(scaler, res[0], res[1], mae)
         if not overstretched:
             res_dict[str(scaler)] = res
             mae_dict[str(scaler)] = mae